@@ -1,13 +1,69 @@
+import hashlib
+import logging
+import math
+import os
 import re
 import subprocess
 import sys
 import json
+import tempfile
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, fields
 from typing import Dict, Optional
 import time
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+_CACHE_DIR = Path('results/.cache')
+# Part of every cache key; bump whenever parse_yosys_output or the
+# SynthesisResults fields change so stale counts are not served
+_CACHE_VERSION = 1
+_READ_VERILOG_RE = re.compile(r'^[ \t]*read_verilog[ \t]+(.+)$', re.MULTILINE)
+_WRITE_OUTPUT_RE = re.compile(r'^[ \t]*(?:tee[ \t]+-o|write_verilog(?:[ \t]+-\S+)*)[ \t]+(\S+)',
+                              re.MULTILINE)
+
+_HIER_MARKER = '=== design hierarchy ==='
+# Anchored to line starts so the engine bails out immediately on header,
+# separator and module-name lines instead of probing every offset
+_STAT_RE = re.compile(r'^[ \t]*(\d+)[ \t]+(cells|wires|public wires|\$_[A-Z]+_|\$\w+)',
+                      re.MULTILINE)
+
+# Summary counters keep their first occurrence in the hierarchy section,
+# gate counters their last
+_SUMMARY_FIELD = {
+    'cells': 'total_cells',
+    'wires': 'wires',
+    'public wires': 'public_wires',
+}
+
+_GATE_FIELD = {
+    '$_AND_': 'and_gates',
+    '$_OR_': 'or_gates',
+    '$_XOR_': 'xor_gates',
+    '$_NOT_': 'not_gates',
+    '$_NAND_': 'nand_gates',
+    '$_NOR_': 'nor_gates',
+    '$_XNOR_': 'xnor_gates',
+    '$_MUX_': 'mux_gates',
+    '$add': 'add_cells',
+}
+
+# Relative area (GE) and switched capacitance per cell, in _GATE_FIELD
+# order followed by cells of any other type
+_AREA_WEIGHTS = (1.33, 1.33, 2.67, 0.67, 1.0, 1.0, 2.67, 2.0, 8.0, 2.0)
+_POWER_WEIGHTS = (2.0, 2.0, 4.0, 1.0, 2.0, 2.0, 4.0, 3.0, 10.0, 2.5)
+
+# Reduction levels of a 32-bit Wallace/Dadda tree (3:2 compressors)
+_TREE_LEVELS_32 = math.ceil(math.log(32) / math.log(1.5))
+
+@dataclass(slots=True)
 class SynthesisResults:
     name: str
     total_cells: int = 0
@@ -29,15 +85,18 @@ class SynthesisResults:
     estimated_power_mw: float = 0.0
     max_frequency_mhz: float = 0.0
     simulation_time_ms: float = 0.0
+    _known_gates: int = field(default=0, repr=False, compare=False)
 
 class MultiplierAnalyzer:
     def __init__(self):
         self.results: Dict[str, SynthesisResults] = {}
+        self.yosys_version = ''
 
     def check_yosys(self):
         try:
             result = subprocess.run(['yosys', '-V'], capture_output=True, text=True)
             version = result.stdout.strip().split('\n')[0]
+            self.yosys_version = version
             print(f"✓ Yosys found: {version}")
             return True
         except FileNotFoundError:
@@ -46,34 +105,94 @@ class MultiplierAnalyzer:
             print("  Linux: sudo apt-get install yosys")
             return False
 
-    def synthesize_design(self, name: str, script_file: str) -> Optional[SynthesisResults]:
-        print(f"\n{'='*70}")
-        print(f"Synthesizing {name} Multiplier")
-        print(f"{'='*70}")
+    def synthesis_cache_file(self, name: str, script_file: str) -> Path:
+        script = Path(script_file).read_bytes()
+        digest = hashlib.sha256(f"{_CACHE_VERSION}\0{self.yosys_version}\0{name}".encode())
+        digest.update(script)
+
+        for sources in _READ_VERILOG_RE.findall(script.decode()):
+            for source in sources.split():
+                if not source.startswith('-'):
+                    digest.update(Path(source).read_bytes())
 
-        result = SynthesisResults(name=name)
+        return _CACHE_DIR / f"{digest.hexdigest()}.json"
 
+    def synthesis_outputs(self, script_file: str) -> list:
+        script = Path(script_file).read_text()
+        return [Path(path) for path in _WRITE_OUTPUT_RE.findall(script)]
+
+    def load_cached_counts(self, cache_file: Path) -> Optional[SynthesisResults]:
         try:
-            cmd = ['yosys', '-s', script_file]
-            print(f"Command: {' '.join(cmd)}")
+            return SynthesisResults(**json.loads(cache_file.read_text()))
+        except (OSError, ValueError, TypeError) as e:
+            # Truncated, corrupt or outdated entries are a miss and get rewritten
+            log.debug("Ignoring cache entry %s: %s", cache_file, e)
+            return None
 
-            proc = subprocess.run(cmd, capture_output=True, text=True, timeout=180)
+    def save_cached_counts(self, cache_file: Path, result: SynthesisResults):
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write beside the entry and rename over it, so an interrupted run
+        # never leaves a partial entry behind
+        fd, tmp = tempfile.mkstemp(dir=cache_file.parent, suffix='.tmp')
+        with os.fdopen(fd, 'w') as out:
+            json.dump({f.name: getattr(result, f.name) for f in fields(result)}, out)
+        os.replace(tmp, cache_file)
 
-            output_file = f"results/{name.lower()}_synthesis.log"
-            with open(output_file, 'w') as f:
-                f.write(proc.stdout)
-                if proc.stderr:
-                    f.write("\n\n=== STDERR ===\n")
-                    f.write(proc.stderr)
+    def synthesize_design(self, name: str, script_file: str, emit=print) -> Optional[SynthesisResults]:
+        emit(f"\n{'='*70}")
+        emit(f"Synthesizing {name} Multiplier")
+        emit(f"{'='*70}")
 
-            if proc.returncode != 0:
-                print(f"⚠ Synthesis completed with warnings")
-                print(f"  Check {output_file} for details")
-            else:
-                print(f"✓ Synthesis completed successfully")
+        output_file = Path('results') / f"{name.lower()}_synthesis.log"
 
-            output = proc.stdout
-            result = self.parse_yosys_output(name, output)
+        try:
+            try:
+                cache_file = self.synthesis_cache_file(name, script_file)
+                outputs = [output_file, *self.synthesis_outputs(script_file)]
+            except (OSError, ValueError) as e:
+                # Unreadable inputs are left for yosys to report in its log
+                log.debug("Not caching %s: %s", name, e)
+                cache_file, outputs = None, []
+
+            # A hit also needs yosys's own outputs, or they would never be regenerated
+            result = None
+            if cache_file is not None and cache_file.exists() and all(p.exists() for p in outputs):
+                result = self.load_cached_counts(cache_file)
+
+            if result is not None:
+                emit(f"✓ Inputs unchanged, using cached synthesis counts: {cache_file}")
+            else:
+                cmd = ['yosys', '-s', script_file]
+                emit(f"Command: {' '.join(cmd)}")
+
+                output_file.parent.mkdir(exist_ok=True)
+                with output_file.open('wb') as f:
+                    proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=f,
+                                            stderr=subprocess.STDOUT)
+                    try:
+                        proc.wait(timeout=180)
+                    except subprocess.TimeoutExpired:
+                        proc.kill()
+                        proc.wait()
+                        raise
+
+                if proc.returncode != 0:
+                    emit(f"⚠ Synthesis completed with warnings")
+                    emit(f"  Check {output_file} for details")
+                else:
+                    emit(f"✓ Synthesis completed successfully")
+
+                # Only the last hierarchy section is parsed, so skip decoding the
+                # (potentially multi-MB) log that precedes it
+                raw = output_file.read_bytes()
+                start = raw.rfind(_HIER_MARKER.encode())
+                output = raw[max(start, 0):].decode(errors='replace')
+                result = self.parse_yosys_output(name, output)
+
+                # Only the parsed counts are cached; the estimates below are
+                # recomputed on every run so model changes take effect
+                if cache_file is not None and proc.returncode == 0:
+                    self.save_cached_counts(cache_file, result)
 
             result.estimated_area_ge = self.calculate_area(result)
             result.critical_path_delay_ns = self.estimate_critical_path(result)
@@ -82,93 +201,56 @@ class MultiplierAnalyzer:
             if result.critical_path_delay_ns > 0:
                 result.max_frequency_mhz = 1000 / result.critical_path_delay_ns
 
-            print(f"  Total cells: {result.total_cells}")
-            print(f"  Estimated area: {result.estimated_area_ge:.1f} GE")
-            print(f"  Critical path: {result.critical_path_delay_ns:.2f} ns")
-            print(f"  Max frequency: {result.max_frequency_mhz:.1f} MHz")
+            emit(f"  Total cells: {result.total_cells}")
+            emit(f"  Estimated area: {result.estimated_area_ge:.1f} GE")
+            emit(f"  Critical path: {result.critical_path_delay_ns:.2f} ns")
+            emit(f"  Max frequency: {result.max_frequency_mhz:.1f} MHz")
 
             return result
 
         except subprocess.TimeoutExpired:
-            print(f"✗ Synthesis timeout for {name}")
+            emit(f"✗ Synthesis timeout for {name}")
             return None
         except Exception as e:
-            print(f"✗ Error synthesizing {name}: {e}")
-            import traceback
-            traceback.print_exc()
+            emit(f"✗ Error synthesizing {name}: {e}")
+            # The traceback goes through emit too, so it stays inside this
+            # design's output block when the designs run concurrently
+            emit(traceback.format_exc().rstrip())
+            log.debug("Error synthesizing %s", name, exc_info=True)
             return None
 
     def parse_yosys_output(self, name: str, output: str) -> SynthesisResults:
-        result = SynthesisResults(name=name)
-
-        hierarchy_sections = list(re.finditer(r'=== design hierarchy ===.*?(?=\n===|\Z)', output, re.DOTALL))
-
-        if hierarchy_sections:
-            hierarchy_text = hierarchy_sections[-1].group(0)
-
-            total_match = re.search(r'(\d+)\s+cells', hierarchy_text)
-            if total_match:
-                result.total_cells = int(total_match.group(1))
-
-            wire_match = re.search(r'(\d+)\s+wires', hierarchy_text)
-            if wire_match:
-                result.wires = int(wire_match.group(1))
-
-            public_match = re.search(r'(\d+)\s+public wires', hierarchy_text)
-            if public_match:
-                result.public_wires = int(public_match.group(1))
-
-            for line in hierarchy_text.split('\n'):
-                line = line.strip()
-                if not line:
-                    continue
-
-                m = re.match(r'(\d+)\s+(\$_[A-Z]+_|\$\w+)', line)
-                if m:
-                    count = int(m.group(1))
-                    gate_type = m.group(2)
-
-                    if gate_type == '$_AND_':
-                        result.and_gates = count
-                    elif gate_type == '$_OR_':
-                        result.or_gates = count
-                    elif gate_type == '$_XOR_':
-                        result.xor_gates = count
-                    elif gate_type == '$_NOT_':
-                        result.not_gates = count
-                    elif gate_type == '$_NAND_':
-                        result.nand_gates = count
-                    elif gate_type == '$_NOR_':
-                        result.nor_gates = count
-                    elif gate_type == '$_XNOR_':
-                        result.xnor_gates = count
-                    elif gate_type == '$_MUX_':
-                        result.mux_gates = count
-                    elif gate_type == '$add':
-                        result.add_cells = count
-
-        return result
+        # Collect parsed counts first and build the result once at the end
+        counts = {}
+
+        start = output.rfind(_HIER_MARKER)
+
+        if start >= 0:
+            end = output.find('\n===', start + 1)
+            if end < 0:
+                end = len(output)
+
+            # Scan the section in place rather than slicing a copy of it
+            for m in _STAT_RE.finditer(output, start, end):
+                count = int(m.group(1))
+                token = m.group(2)
+
+                if token in _SUMMARY_FIELD:
+                    counts.setdefault(_SUMMARY_FIELD[token], count)
+                elif token in _GATE_FIELD:
+                    counts[_GATE_FIELD[token]] = count
+
+        known_gates = sum(counts.get(attr, 0) for attr in _GATE_FIELD.values())
+
+        return SynthesisResults(name=name, _known_gates=known_gates, **counts)
 
     def calculate_area(self, result: SynthesisResults) -> float:
-        area = 0.0
-        area += result.and_gates * 1.33
-        area += result.or_gates * 1.33
-        area += result.xor_gates * 2.67
-        area += result.not_gates * 0.67
-        area += result.nand_gates * 1.0
-        area += result.nor_gates * 1.0
-        area += result.xnor_gates * 2.67
-        area += result.mux_gates * 2.0
-        area += result.add_cells * 8.0
-
-        known_gates = (result.and_gates + result.or_gates + result.xor_gates +
-                      result.not_gates + result.nand_gates + result.nor_gates +
-                      result.xnor_gates + result.mux_gates + result.add_cells)
-
-        other_cells = max(0, result.total_cells - known_gates)
-        area += other_cells * 2.0
-
-        return area
+        counts = [getattr(result, attr) for attr in _GATE_FIELD.values()]
+
+        other_cells = max(0, result.total_cells - result._known_gates)
+        counts.append(other_cells)
+
+        return sum(count * weight for count, weight in zip(counts, _AREA_WEIGHTS))
 
     def estimate_critical_path(self, result: SynthesisResults) -> float:
         if result.name == "Classical":
@@ -176,19 +258,10 @@ class MultiplierAnalyzer:
             delay_per_stage = 0.3
             return levels * delay_per_stage
 
-        elif result.name == "Wallace":
-            import math
-            levels = math.ceil(math.log(32) / math.log(1.5))
-            delay_per_level = 0.25
-            final_adder_delay = 2.0
-            return levels * delay_per_level + final_adder_delay
-
-        elif result.name == "Dadda":
-            import math
-            levels = math.ceil(math.log(32) / math.log(1.5))
+        elif result.name in ("Wallace", "Dadda"):
             delay_per_level = 0.25
             final_adder_delay = 2.0
-            return levels * delay_per_level + final_adder_delay
+            return _TREE_LEVELS_32 * delay_per_level + final_adder_delay
 
         return 5.0
 
@@ -198,22 +271,12 @@ class MultiplierAnalyzer:
         activity = 0.2
         cap_per_gate = 1e-15
 
-        total_cap = 0.0
-        total_cap += result.and_gates * 2.0 * cap_per_gate
-        total_cap += result.or_gates * 2.0 * cap_per_gate
-        total_cap += result.xor_gates * 4.0 * cap_per_gate
-        total_cap += result.not_gates * 1.0 * cap_per_gate
-        total_cap += result.nand_gates * 2.0 * cap_per_gate
-        total_cap += result.nor_gates * 2.0 * cap_per_gate
-        total_cap += result.xnor_gates * 4.0 * cap_per_gate
-        total_cap += result.mux_gates * 3.0 * cap_per_gate
-        total_cap += result.add_cells * 10.0 * cap_per_gate
-
-        known_gates = (result.and_gates + result.or_gates + result.xor_gates +
-                      result.not_gates + result.nand_gates + result.nor_gates +
-                      result.xnor_gates + result.mux_gates + result.add_cells)
-        other_cells = max(0, result.total_cells - known_gates)
-        total_cap += other_cells * 2.5 * cap_per_gate
+        counts = [getattr(result, attr) for attr in _GATE_FIELD.values()]
+
+        other_cells = max(0, result.total_cells - result._known_gates)
+        counts.append(other_cells)
+
+        total_cap = sum(count * weight for count, weight in zip(counts, _POWER_WEIGHTS)) * cap_per_gate
 
         power_w = activity * total_cap * (voltage ** 2) * frequency
         power_mw = power_w * 1000
@@ -228,17 +291,27 @@ class MultiplierAnalyzer:
         has_yosys = self.check_yosys()
 
         if has_yosys:
-            classical = self.synthesize_design("Classical", "synthesis/synthesize_classical.ys")
-            if classical:
-                self.results["Classical"] = classical
-
-            dadda = self.synthesize_design("Dadda", "synthesis/synthesize_dadda.ys")
-            if dadda:
-                self.results["Dadda"] = dadda
-
-            wallace = self.synthesize_design("Wallace", "synthesis/synthesize_wallace.ys")
-            if wallace:
-                self.results["Wallace"] = wallace
+            jobs = [
+                ("Classical", "synthesis/synthesize_classical.ys"),
+                ("Dadda", "synthesis/synthesize_dadda.ys"),
+                ("Wallace", "synthesis/synthesize_wallace.ys"),
+            ]
+
+            # yosys runs out of process, so the three designs synthesize in parallel.
+            # Each buffers its console lines, printed here in submission order so
+            # every status block stays under its own design's header
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                futures = []
+                for name, script in jobs:
+                    lines = []
+                    futures.append((name, lines, executor.submit(self.synthesize_design, name,
+                                                                  script, lines.append)))
+
+                for name, lines, future in futures:
+                    result = future.result()
+                    sys.stdout.write('\n'.join(lines) + '\n')
+                    if result:
+                        self.results[name] = result
         else:
             print("\n⚠ Yosys not available - using theoretical estimates")
             self.results["Classical"] = SynthesisResults(
@@ -257,93 +330,105 @@ class MultiplierAnalyzer:
         self.generate_report()
 
     def generate_report(self):
-        print(f"\n{'='*70}")
-        print("DETAILED COMPARISON REPORT")
-        print(f"{'='*70}\n")
+        lines = []
+
+        lines.append(f"\n{'='*70}")
+        lines.append("DETAILED COMPARISON REPORT")
+        lines.append(f"{'='*70}\n")
 
         if not self.results:
-            print("No results to display.")
+            lines.append("No results to display.")
+            sys.stdout.write('\n'.join(lines) + '\n')
             return
 
-        print("="*70)
-        print("1. AREA ANALYSIS")
-        print("="*70)
-        print(f"{'Multiplier':<15} {'Cells':<12} {'Area (GE)':<15} {'Relative':<12}")
-        print("-"*70)
-
-        areas = {name: res.estimated_area_ge for name, res in self.results.items()}
-        min_area = min(areas.values()) if areas else 1
-
-        for name in ["Classical", "Dadda", "Wallace"]:
-            if name in self.results:
-                res = self.results[name]
-                relative = f"{res.estimated_area_ge / min_area:.2f}x"
-                print(f"{name:<15} {res.total_cells:<12} {res.estimated_area_ge:<15.1f} {relative:<12}")
-
-        print(f"\n{'='*70}")
-        print("2. TIMING ANALYSIS")
-        print("="*70)
-        print(f"{'Multiplier':<15} {'Delay (ns)':<15} {'Max Freq (MHz)':<15} {'Speedup':<12}")
-        print("-"*70)
-
-        delays = {name: res.critical_path_delay_ns for name, res in self.results.items()}
-        max_delay = max(delays.values()) if delays else 1
-
-        for name in ["Classical", "Dadda", "Wallace"]:
-            if name in self.results:
-                res = self.results[name]
-                speedup = f"{max_delay / res.critical_path_delay_ns:.2f}x"
-                print(f"{name:<15} {res.critical_path_delay_ns:<15.2f} {res.max_frequency_mhz:<15.1f} {speedup:<12}")
-
-        print(f"\n{'='*70}")
-        print("3. POWER CONSUMPTION (@ 100 MHz)")
-        print("="*70)
-        print(f"{'Multiplier':<15} {'Power (mW)':<15} {'Energy/Op (pJ)':<18} {'Relative':<12}")
-        print("-"*70)
-
-        powers = {name: res.estimated_power_mw for name, res in self.results.items()}
-        min_power = min(powers.values()) if powers else 1
-
+        # Relative baselines and per-metric winners, gathered in one pass
+        min_area = min_power = min_delay = float('inf')
+        max_delay = float('-inf')
+        best_speed = best_area = best_power = None
+        for name, res in self.results.items():
+            if res.estimated_area_ge < min_area:
+                min_area = res.estimated_area_ge
+                best_area = (name, res)
+            if res.estimated_power_mw < min_power:
+                min_power = res.estimated_power_mw
+                best_power = (name, res)
+            if res.critical_path_delay_ns < min_delay:
+                min_delay = res.critical_path_delay_ns
+                best_speed = (name, res)
+            if res.critical_path_delay_ns > max_delay:
+                max_delay = res.critical_path_delay_ns
+
+        # Format every section's rows in one pass over the designs
+        area_rows, timing_rows, power_rows, gate_rows = [], [], [], []
         for name in ["Classical", "Dadda", "Wallace"]:
-            if name in self.results:
-                res = self.results[name]
-                energy_pj = res.estimated_power_mw * 10
-                relative = f"{res.estimated_power_mw / min_power:.2f}x"
-                print(f"{name:<15} {res.estimated_power_mw:<15.2f} {energy_pj:<18.1f} {relative:<12}")
-
-        print(f"\n{'='*70}")
-        print("4. GATE TYPE BREAKDOWN")
-        print("="*70)
-
-        for name in ["Classical", "Dadda", "Wallace"]:
-            if name in self.results:
-                res = self.results[name]
-                print(f"\n{name} Multiplier:")
-                print(f"  AND gates:   {res.and_gates:>6}")
-                print(f"  OR gates:    {res.or_gates:>6}")
-                print(f"  XOR gates:   {res.xor_gates:>6}")
-                print(f"  NOT gates:   {res.not_gates:>6}")
-                print(f"  NAND gates:  {res.nand_gates:>6}")
-                print(f"  NOR gates:   {res.nor_gates:>6}")
-                print(f"  XNOR gates:  {res.xnor_gates:>6}")
-                print(f"  MUX gates:   {res.mux_gates:>6}")
-                print(f"  ADD cells:   {res.add_cells:>6}")
-                print(f"  {'─'*20}")
-                print(f"  Total:       {res.total_cells:>6}")
-
-        print(f"\n{'='*70}")
-        print("5. SPEEDUP ANALYSIS")
-        print("="*70)
+            res = self.results.get(name)
+            if res is None:
+                continue
+
+            relative = f"{res.estimated_area_ge / min_area:.2f}x"
+            area_rows.append(f"{name:<15} {res.total_cells:<12} {res.estimated_area_ge:<15.1f} {relative:<12}")
+
+            speedup = f"{max_delay / res.critical_path_delay_ns:.2f}x"
+            timing_rows.append(f"{name:<15} {res.critical_path_delay_ns:<15.2f} {res.max_frequency_mhz:<15.1f} {speedup:<12}")
+
+            energy_pj = res.estimated_power_mw * 10
+            relative = f"{res.estimated_power_mw / min_power:.2f}x"
+            power_rows.append(f"{name:<15} {res.estimated_power_mw:<15.2f} {energy_pj:<18.1f} {relative:<12}")
+
+            gate_rows += [
+                f"\n{name} Multiplier:",
+                f"  AND gates:   {res.and_gates:>6}",
+                f"  OR gates:    {res.or_gates:>6}",
+                f"  XOR gates:   {res.xor_gates:>6}",
+                f"  NOT gates:   {res.not_gates:>6}",
+                f"  NAND gates:  {res.nand_gates:>6}",
+                f"  NOR gates:   {res.nor_gates:>6}",
+                f"  XNOR gates:  {res.xnor_gates:>6}",
+                f"  MUX gates:   {res.mux_gates:>6}",
+                f"  ADD cells:   {res.add_cells:>6}",
+                f"  {'─'*20}",
+                f"  Total:       {res.total_cells:>6}",
+            ]
+
+        lines.append("="*70)
+        lines.append("1. AREA ANALYSIS")
+        lines.append("="*70)
+        lines.append(f"{'Multiplier':<15} {'Cells':<12} {'Area (GE)':<15} {'Relative':<12}")
+        lines.append("-"*70)
+        lines.extend(area_rows)
+
+        lines.append(f"\n{'='*70}")
+        lines.append("2. TIMING ANALYSIS")
+        lines.append("="*70)
+        lines.append(f"{'Multiplier':<15} {'Delay (ns)':<15} {'Max Freq (MHz)':<15} {'Speedup':<12}")
+        lines.append("-"*70)
+        lines.extend(timing_rows)
+
+        lines.append(f"\n{'='*70}")
+        lines.append("3. POWER CONSUMPTION (@ 100 MHz)")
+        lines.append("="*70)
+        lines.append(f"{'Multiplier':<15} {'Power (mW)':<15} {'Energy/Op (pJ)':<18} {'Relative':<12}")
+        lines.append("-"*70)
+        lines.extend(power_rows)
+
+        lines.append(f"\n{'='*70}")
+        lines.append("4. GATE TYPE BREAKDOWN")
+        lines.append("="*70)
+        lines.extend(gate_rows)
+
+        lines.append(f"\n{'='*70}")
+        lines.append("5. SPEEDUP ANALYSIS")
+        lines.append("="*70)
 
         if "Classical" in self.results and "Wallace" in self.results:
             c_delay = self.results["Classical"].critical_path_delay_ns
             w_delay = self.results["Wallace"].critical_path_delay_ns
-            print(f"✓ Wallace is {c_delay / w_delay:.2f}x FASTER than Classical")
+            lines.append(f"✓ Wallace is {c_delay / w_delay:.2f}x FASTER than Classical")
 
         if "Classical" in self.results and "Dadda" in self.results:
             c_delay = self.results["Classical"].critical_path_delay_ns
             d_delay = self.results["Dadda"].critical_path_delay_ns
-            print(f"✓ Dadda is {c_delay / d_delay:.2f}x FASTER than Classical")
+            lines.append(f"✓ Dadda is {c_delay / d_delay:.2f}x FASTER than Classical")
 
         if "Wallace" in self.results and "Dadda" in self.results:
             w_area = self.results["Wallace"].estimated_area_ge
@@ -354,22 +439,18 @@ class MultiplierAnalyzer:
             timing_diff = abs(w_delay - d_delay) / min(w_delay, d_delay) * 100
             area_saving = (w_area - d_area) / w_area * 100
 
-            print(f"✓ Wallace vs Dadda: {timing_diff:.1f}% timing difference")
-            print(f"✓ Dadda is {area_saving:.1f}% SMALLER than Wallace")
-
-        print(f"\n{'='*70}")
-        print("6. RECOMMENDATION")
-        print("="*70)
+            lines.append(f"✓ Wallace vs Dadda: {timing_diff:.1f}% timing difference")
+            lines.append(f"✓ Dadda is {area_saving:.1f}% SMALLER than Wallace")
 
-        best_speed = min(self.results.items(), key=lambda x: x[1].critical_path_delay_ns)
-        best_area = min(self.results.items(), key=lambda x: x[1].estimated_area_ge)
-        best_power = min(self.results.items(), key=lambda x: x[1].estimated_power_mw)
+        lines.append(f"\n{'='*70}")
+        lines.append("6. RECOMMENDATION")
+        lines.append("="*70)
 
-        print(f"\n✓ Fastest:      {best_speed[0]} ({best_speed[1].critical_path_delay_ns:.2f} ns)")
-        print(f"✓ Smallest:     {best_area[0]} ({best_area[1].estimated_area_ge:.1f} GE)")
-        print(f"✓ Least Power:  {best_power[0]} ({best_power[1].estimated_power_mw:.2f} mW)")
+        lines.append(f"\n✓ Fastest:      {best_speed[0]} ({best_speed[1].critical_path_delay_ns:.2f} ns)")
+        lines.append(f"✓ Smallest:     {best_area[0]} ({best_area[1].estimated_area_ge:.1f} GE)")
+        lines.append(f"✓ Least Power:  {best_power[0]} ({best_power[1].estimated_power_mw:.2f} mW)")
 
-        print("""
+        lines.append("""
 OVERALL RECOMMENDATION for 32-bit multiplication:
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 • Classical: Educational use only - too slow for production
@@ -380,13 +461,20 @@ OVERALL RECOMMENDATION for 32-bit multiplication:
 For production designs: DADDA multiplier is recommended
 """)
 
+        sys.stdout.write('\n'.join(lines) + '\n')
+
         self.save_results()
 
     def save_results(self):
-        output = {name: asdict(res) for name, res in self.results.items()}
+        output = {name: {f.name: getattr(res, f.name) for f in fields(res)
+                         if not f.name.startswith('_')}
+                  for name, res in self.results.items()}
 
-        with open('results/analysis_results.json', 'w') as f:
-            json.dump(output, f, indent=2)
+        output_file = Path('results/analysis_results.json')
+        if orjson is not None:
+            output_file.write_bytes(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+        else:
+            output_file.write_text(json.dumps(output, indent=2))
 
         print(f"\n{'='*70}")
         print("Results saved to: results/analysis_results.json")
